@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Generate the current and proposed audit system architecture diagrams
+
+Both diagrams are rendered from one module so matplotlib, the Agg backend
+and the font cache are loaded once per process. matplotlib is imported
+lazily, only once a diagram actually needs rendering, so ``--help`` and
+up-to-date runs stay cheap.
+"""
+
+import argparse
+import math
+import os
+from functools import lru_cache
+
+from diagram_cache import is_fresh, mark_fresh, output_path, source_hash
+
+# Resolution for PNG output; the diagrams have no detail that needs more than 150 dpi
+DIAGRAM_DPI = int(os.environ.get('DIAGRAM_DPI', '150'))
+
+# Define colors
+java_color = '#FF6B35'
+mitm_color = '#F7931E'
+audit_color = '#4ECDC4'
+credential_color = '#45B7D1'
+rust_color = '#CE422B'
+ipc_color = '#96CEB4'
+web_color = '#45B7D1'
+unchanged_color = '#4ECDC4'
+
+
+@lru_cache(maxsize=None)
+def font(size, weight='normal', style='normal'):
+    """Shared FontProperties per (size, weight, style) so texts reuse font state"""
+    from matplotlib.font_manager import FontProperties
+
+    return FontProperties(size=size, weight=weight, style=style)
+
+
+def arrow_tip(start, end, size=0.08):
+    """Triangle vertices for an arrowhead at ``end`` pointing away from ``start``"""
+    (x0, y0), (x1, y1) = start, end
+    length = math.hypot(x1 - x0, y1 - y0)
+    ux, uy = (x1 - x0) / length, (y1 - y0) / length
+    bx, by = x1 - ux * size, y1 - uy * size
+    half = size / 2
+    return [(x1, y1), (bx - uy * half, by + ux * half), (bx + uy * half, by - ux * half)]
+
+
+def _make_layer_box(ax, xy, wh, color, title, title_offset=0.3, fontsize=14,
+                    pad=0.05, linewidth=1, alpha=0.7, title_color='black'):
+    """Rounded container box with its title centred near the top edge"""
+    from matplotlib.patches import FancyBboxPatch
+
+    (x, y), (w, h) = xy, wh
+    ax.add_patch(FancyBboxPatch(xy, w, h,
+                                boxstyle=f"round,pad={pad}",
+                                facecolor=color,
+                                edgecolor='black',
+                                linewidth=linewidth,
+                                alpha=alpha))
+    ax.text(x + w / 2, y + h - title_offset, title, fontproperties=font(fontsize, 'bold'),
+            ha='center', color=title_color)
+
+
+def _make_component_grid(ax, items, facecolor, height=0.3, fontsize=8, alpha=None):
+    """Labelled component boxes for (label, x, y) items, drawn as one polygon collection"""
+    import numpy as np
+    from matplotlib.collections import PolyCollection
+
+    half = height / 2
+    centers = np.array([(x, y) for _, x, y in items], dtype=float)
+    corners = np.array([(-0.4, -half), (0.4, -half), (0.4, half), (-0.4, half)])
+    # (N, 1, 2) centres + (4, 2) corner offsets -> (N, 4, 2) rectangle vertices
+    ax.add_collection(PolyCollection(centers[:, np.newaxis, :] + corners,
+                                     facecolors=facecolor, edgecolors='black',
+                                     linewidths=0.5, alpha=alpha))
+
+    label_font = font(fontsize)
+    for label, x, y in items:
+        ax.text(x, y, label, fontproperties=label_font, ha='center', va='center')
+
+
+def _draw_arrows(ax, arrows):
+    """Draw (start, end, color, linewidth) arrows as one line collection plus one collection of heads"""
+    from matplotlib.collections import LineCollection, PolyCollection
+
+    arrow_colors = [color for _, _, color, _ in arrows]
+    ax.add_collection(LineCollection([(start, end) for start, end, _, _ in arrows],
+                                     colors=arrow_colors,
+                                     linewidths=[width for _, _, _, width in arrows]))
+    ax.add_collection(PolyCollection([arrow_tip(start, end) for start, end, _, _ in arrows],
+                                     facecolors=arrow_colors, edgecolors=arrow_colors))
+
+
+def _draw_current(ax):
+    """Current monolithic Java audit system"""
+    # Title
+    ax.text(5, 9.5, 'Current Monolithic Java Audit System',
+            fontproperties=font(18, 'bold'), ha='center')
+
+    # Main container - Java Audit System
+    _make_layer_box(ax, (0.5, 1), (9, 7.5), java_color, 'Java Audit System',
+                    fontsize=16, pad=0.1, linewidth=2, alpha=0.3)
+
+    # MITM Proxy Layer
+    _make_layer_box(ax, (1, 6), (8, 1.8), mitm_color, 'MITM Proxy Layer')
+
+    # MITM components
+    mitm_components = [
+        ('MonitorSSHAudit.java', 1.5, 6.8),
+        ('MonitorVNCAudit.java', 3.5, 6.8),
+        ('Rdp2ProxyHandler.java', 5.5, 6.8),
+        ('SessionInfo.java', 7.5, 6.8)
+    ]
+    _make_component_grid(ax, [(comp.split('.')[0], x, y) for comp, x, y in mitm_components], 'white')
+
+    # Audit Logging Layer
+    _make_layer_box(ax, (1, 3.5), (8, 1.8), audit_color, 'Audit Logging Layer')
+
+    # Audit components
+    audit_components = [
+        ('AuditFile.java', 1.5, 4.3),
+        ('DatabaseAuditWriter.java', 3.5, 4.3),
+        ('TerminalAuditWriter.java', 5.5, 4.3),
+        ('GuessingConnectionLinker.java', 7.5, 4.3)
+    ]
+    _make_component_grid(ax, [(comp.split('.')[0], x, y) for comp, x, y in audit_components], 'white')
+
+    # Credential Injection Service
+    _make_layer_box(ax, (1, 1.5), (8, 1.2), credential_color, 'Credential Injection Service',
+                    title_offset=0.2)
+    ax.text(5, 1.9, 'CredentialInjectionService.java (Parent Integration)', fontproperties=font(10), ha='center')
+
+    # Connection arrows showing tight coupling
+    arrows = [
+        ((5, 6), (5, 5.3), 'red', 2),    # MITM to Audit
+        ((5, 6), (5, 2.7), 'red', 2),    # MITM to Credential
+        ((5, 3.5), (5, 2.7), 'red', 2),  # Audit to Credential
+    ]
+
+    # Add coupling indicators
+    ax.text(5.5, 5.7, 'Tight\nCoupling', fontproperties=font(10), ha='center',
+            bbox=dict(boxstyle="round,pad=0.3", facecolor='red', alpha=0.3))
+
+    # External connections
+    ax.text(0.2, 7, 'Client\nConnections', fontproperties=font(10), ha='center', va='center',
+            bbox=dict(boxstyle="round,pad=0.2", facecolor='lightblue'))
+
+    # Arrow from client to MITM
+    arrows.append(((0.8, 7), (1, 7), 'blue', 1))
+
+    # Problems annotation
+    problems_text = """Problems with Current Architecture:
+• Tight coupling between MITM and audit
+• Single point of failure
+• Difficult to add web client support
+• Complex threading model
+• Data loss risk from coupling"""
+
+    ax.text(0.5, 0.5, problems_text, fontproperties=font(10), va='bottom',
+            bbox=dict(boxstyle="round,pad=0.3", facecolor='yellow', alpha=0.7))
+
+    _draw_arrows(ax, arrows)
+
+
+def _draw_proposed(ax):
+    """Proposed separated Rust MITM + Java audit architecture"""
+    from matplotlib.collections import LineCollection
+
+    # Title
+    ax.text(6, 9.5, 'Proposed Separated Architecture: Rust MITM + Java Audit',
+            fontproperties=font(18, 'bold'), ha='center')
+
+    # Rust MITM Process (Left side)
+    _make_layer_box(ax, (0.5, 5), (4.5, 3.5), rust_color, 'Rust MITM Process',
+                    fontsize=16, pad=0.1, linewidth=2, alpha=0.3, title_color='white')
+
+    # Rust components
+    rust_components = [
+        ('SSH MITM\n(russh)', 1.5, 7.5),
+        ('RDP MITM\n(IronRDP)', 4, 7.5),
+        ('WebSocket\nStreaming', 1.5, 6.5),
+        ('Credential Lookup\nvia IPC', 4, 6.5),
+        ('Protocol State\nManagement', 2.75, 5.5)
+    ]
+    _make_component_grid(ax, rust_components, 'white', height=0.5, fontsize=9)
+
+    # Java Audit Process (Right side)
+    _make_layer_box(ax, (7, 5), (4.5, 3.5), java_color, 'Java Audit Process',
+                    fontsize=16, pad=0.1, linewidth=2, alpha=0.3)
+
+    # Java components (UNCHANGED)
+    java_components = [
+        ('AuditFile.java\n(UNCHANGED)', 8, 7.5),
+        ('DatabaseAuditWriter.java\n(UNCHANGED)', 10.5, 7.5),
+        ('TerminalAuditWriter.java\n(UNCHANGED)', 8, 6.5),
+        ('GuessingConnectionLinker.java\n(UNCHANGED)', 10.5, 6.5),
+        ('CredentialInjectionService.java\n(UNCHANGED)', 9.25, 5.5)
+    ]
+    _make_component_grid(ax, [(comp.split('\n')[0], x, y) for comp, x, y in java_components],
+                         unchanged_color, height=0.5, alpha=0.8)
+    unchanged_font = font(7, 'bold', 'italic')
+    for _, x, y in java_components:
+        ax.text(x, y-0.15, '(UNCHANGED)', fontproperties=unchanged_font,
+                ha='center', va='center', color='green')
+
+    # IPC Interface (Center)
+    _make_layer_box(ax, (5.25, 6), (1.5, 2), ipc_color, 'IPC Interface',
+                    title_offset=0.5, fontsize=12, linewidth=2, alpha=0.8)
+
+    ipc_components = [
+        'Credential Lookup',
+        'Audit Events',
+        'Session Lifecycle',
+        'WebSocket Data'
+    ]
+
+    label_font = font(8)
+    for i, comp in enumerate(ipc_components):
+        ax.text(6, 7.2 - i*0.2, f'• {comp}', fontproperties=label_font, ha='center')
+
+    # Bidirectional IPC arrows
+    arrows = [
+        ((5, 7), (5.25, 7), 'green', 3),
+        ((6.75, 7), (7, 7), 'green', 3),
+        ((7, 6.5), (6.75, 6.5), 'green', 3),
+        ((5.25, 6.5), (5, 6.5), 'green', 3),
+    ]
+
+    # Client connections
+    ax.text(0.2, 7, 'Native\nClients', fontproperties=font(10), ha='center', va='center',
+            bbox=dict(boxstyle="round,pad=0.2", facecolor='lightblue'))
+
+    ax.text(0.2, 5.5, 'Web\nClients', fontproperties=font(10), ha='center', va='center',
+            bbox=dict(boxstyle="round,pad=0.2", facecolor=web_color))
+
+    # Client arrows to Rust MITM
+    arrows += [
+        ((0.8, 7), (0.5, 7), 'blue', 1),
+        ((0.8, 5.5), (0.5, 6), web_color, 1),
+    ]
+
+    # External systems
+    ax.text(9.25, 4.5, 'Database', fontproperties=font(10), ha='center', va='center',
+            bbox=dict(boxstyle="round,pad=0.2", facecolor='lightgray'))
+
+    ax.text(11, 4.5, 'Audit Files', fontproperties=font(10), ha='center', va='center',
+            bbox=dict(boxstyle="round,pad=0.2", facecolor='lightgray'))
+
+    # Arrows to external systems
+    arrows += [
+        ((9.25, 5), (9.25, 4.7), 'gray', 1),
+        ((10.5, 5), (11, 4.7), 'gray', 1),
+    ]
+
+    # Benefits annotation
+    benefits_text = """Benefits of Separated Architecture:
+• Loose coupling via IPC interface
+• Independent failure domains
+• Web client support built-in
+• Rust memory safety and performance
+• Preserved audit architecture (95% unchanged)
+• Minimal risk to existing functionality"""
+
+    ax.text(0.5, 3.5, benefits_text, fontproperties=font(11), va='top',
+            bbox=dict(boxstyle="round,pad=0.3", facecolor='lightgreen', alpha=0.7))
+
+    # Technical details
+    tech_text = """Technical Implementation:
+• IPC: Unix Domain Sockets / Named Pipes
+• Serialization: MessagePack (binary)
+• Error Handling: Timeout + Retry + Fallback
+• Performance: <10ms IPC overhead
+• Compatibility: 100% audit format preservation"""
+
+    ax.text(6.5, 3.5, tech_text, fontproperties=font(11), va='top',
+            bbox=dict(boxstyle="round,pad=0.3", facecolor='lightyellow', alpha=0.7))
+
+    # Data flow indicators
+    ax.text(6, 8.7, '↕ Bidirectional IPC', fontproperties=font(10), ha='center',
+            bbox=dict(boxstyle="round,pad=0.2", facecolor='green', alpha=0.3))
+
+    # Process separation indicator
+    ax.add_collection(LineCollection([((5.75, 4.5), (5.75, 8.5))],
+                                     linestyles='--', linewidths=3, colors='red', alpha=0.7))
+    ax.text(5.75, 4.2, 'Process Boundary', fontproperties=font(10, 'bold'), ha='center', color='red')
+
+    _draw_arrows(ax, arrows)
+
+
+# kind -> (figsize, xlim, draw function); xlim starts at -0.5 so the client
+# labels centred at x=0.2 stay on the canvas
+DIAGRAMS = {
+    'current': ((14, 10), (-0.5, 10), _draw_current),
+    'proposed': ((16, 12), (-0.5, 12), _draw_proposed),
+}
+
+
+def render(kind: str, outpath: str):
+    """Render the ``kind`` diagram ('current' or 'proposed') to ``outpath``
+
+    The format follows the file extension; SVG output bypasses Agg rasterization.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    figsize, xlim, draw = DIAGRAMS[kind]
+
+    # Set up the figure
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1)
+    ax.set_xlim(*xlim)
+    ax.set_ylim(0, 10)
+    ax.set_autoscale_on(False)
+    ax.axis('off')
+
+    # The layout is fixed in data coordinates, so let the axes fill the figure
+    # instead of paying for a tight-bbox pass in savefig
+    fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
+
+    draw(ax)
+
+    fig.savefig(outpath, dpi=DIAGRAM_DPI)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate the architecture diagrams.')
+    parser.add_argument('kinds', nargs='*', metavar='kind',
+                        help=f"diagrams to render: {', '.join(DIAGRAMS)} (default: all)")
+    parser.add_argument('--force', action='store_true',
+                        help='render even if the output is up to date')
+    args = parser.parse_args(argv)
+    for kind in args.kinds:
+        if kind not in DIAGRAMS:
+            parser.error(f"unknown diagram {kind!r}, choose from: {', '.join(DIAGRAMS)}")
+
+    src_hash = source_hash()
+    for kind in args.kinds or DIAGRAMS:
+        outpath = output_path(kind)
+        if not args.force and is_fresh(outpath, src_hash):
+            continue
+        render(kind, outpath)
+        mark_fresh(outpath, src_hash)
+        print(f"{kind.capitalize()} architecture diagram saved as: {outpath}")
+
+
+if __name__ == '__main__':
+    main()
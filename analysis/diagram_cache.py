@@ -0,0 +1,44 @@
+"""
+Skip re-rendering a diagram whose inputs have not changed
+
+Each rendered file gets a ``<output>.sha`` sidecar holding a hash of the
+rendering code that produced it. This module only uses the standard library so the
+check can run before matplotlib is imported.
+"""
+
+import hashlib
+import os
+
+# Output format; the diagrams are pure vector content, so SVG by default
+DIAGRAM_FORMAT = os.environ.get('DIAGRAM_FORMAT', 'svg')
+
+# All diagram content lives here, so its source determines the output
+_RENDERER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'architecture_diagrams.py')
+
+
+def output_path(kind):
+    """Output file for the ``kind`` diagram in the configured format"""
+    return f'docs/analysis/{kind}-architecture.{DIAGRAM_FORMAT}'
+
+
+def source_hash():
+    """Short hash of the rendering code and the DIAGRAM_DPI setting"""
+    with open(_RENDERER, 'rb') as f:
+        digest = hashlib.blake2b(f.read())
+    digest.update(os.environ.get('DIAGRAM_DPI', '').encode())
+    return digest.hexdigest()[:16]
+
+
+def is_fresh(outpath, src_hash):
+    """True if ``outpath`` exists and was rendered from sources matching ``src_hash``"""
+    try:
+        with open(outpath + '.sha') as f:
+            return f.read().strip() == src_hash and os.path.exists(outpath)
+    except OSError:
+        return False
+
+
+def mark_fresh(outpath, src_hash):
+    """Record ``src_hash`` as the source hash of ``outpath``"""
+    with open(outpath + '.sha', 'w') as f:
+        f.write(src_hash + '\n')